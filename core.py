@@ -0,0 +1,115 @@
+from typing import NamedTuple
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+
+# --- Site Profiles ---
+class SiteProfile(NamedTuple):
+    area: float = 0
+    u_value: float = 0.15
+    indoor_temp: float = 20
+    outdoor_temp: float = 5
+    system_loss: float = 0.5
+    boiler_eff: float = 0.85
+    co2_factor: float = 0.23
+    elec_price: float = 0.25
+    chp_installed: str = "No"
+    chp_th: float = 0
+    chp_el: float = 0
+    chp_gas: float = 0
+    chp_hours: int = 0
+    chp_adj: float = 0.95
+    hp_installed: str = "No"
+    hp_th: float = 0
+    hp_hours: int = 0
+    hp_cop: float = 0
+
+
+SITES = {
+    "Barnwell": SiteProfile(
+        area=22102,
+        u_value=0.15,
+        indoor_temp=20,
+        outdoor_temp=5,
+        system_loss=0.50,
+        boiler_eff=0.85,
+        co2_factor=0.23,
+        elec_price=0.25,
+        chp_installed="Yes",
+        chp_th=44.7,
+        chp_el=19.965,
+        chp_gas=67.9,
+        chp_hours=15,
+        chp_adj=0.95,
+        hp_installed="Yes",
+        hp_th=60,
+        hp_hours=9,
+        hp_cop=4
+    ),
+    "Custom": SiteProfile()
+}
+
+# --- Monthly Climate ---
+MONTH_NAMES = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+MONTHLY_TEMPS = np.array([5.0, 5.5, 7.0, 9.0, 11.0, 13.5, 15.0, 15.0, 13.0, 10.0, 7.0, 5.5], dtype=np.float64)
+DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int32)
+MONTHLY_TEMPS.flags.writeable = False
+DAYS_IN_MONTH.flags.writeable = False
+
+# --- Calculations ---
+def heat_kwh(u_value, area, indoor_temp, outdoor_temp, system_loss, days=1):
+    return u_value * area * 24.0 / 1000.0 * (1.0 + system_loss) * (indoor_temp - outdoor_temp) * days
+
+
+def _forecast_kernel(u_value, area, indoor_temp, system_loss,
+                     chp_th, chp_adj, chp_hours, chp_mul, hp_th, hp_hours, hp_mul, temps, days):
+    heat = heat_kwh(u_value, area, indoor_temp, temps, system_loss, days)
+    chp_m = chp_mul * chp_th * chp_adj * chp_hours * days
+    hp_m = hp_mul * hp_th * hp_hours * days
+    boiler = np.maximum(0.0, heat - chp_m - hp_m)
+    return heat, chp_m, hp_m, boiler
+
+
+@st.cache_data
+def compute_daily(u_value, area, indoor_temp, outdoor_temp, system_loss, boiler_eff, co2_factor,
+                  chp_on, chp_th, chp_adj, chp_hours, hp_on, hp_th, hp_hours):
+    chp_mul = float(chp_on == "Yes")
+    hp_mul = float(hp_on == "Yes")
+    heat_demand = heat_kwh(u_value, area, indoor_temp, outdoor_temp, system_loss)
+    chp_thermal = chp_mul * chp_th * chp_adj * chp_hours
+    hp_thermal = hp_mul * hp_th * hp_hours
+    boiler_diff = heat_demand - chp_thermal - hp_thermal
+    boiler_thermal = boiler_diff if boiler_diff > 0 else 0.0
+    boiler_gas_input = boiler_thermal / boiler_eff if boiler_eff > 0 else 0
+    co2_emission = boiler_gas_input * co2_factor
+    return heat_demand, chp_thermal, hp_thermal, boiler_thermal, boiler_gas_input, co2_emission
+
+
+@st.cache_data
+def compute_forecast(u_value, area, indoor_temp, system_loss,
+                     chp_on, chp_th, chp_adj, chp_hours, hp_on, hp_th, hp_hours) -> pd.DataFrame:
+    chp_mul = float(chp_on == "Yes")
+    hp_mul = float(hp_on == "Yes")
+    heat, chp_m, hp_m, boiler = _forecast_kernel(
+        u_value, area, indoor_temp, system_loss,
+        chp_th, chp_adj, chp_hours, chp_mul, hp_th, hp_hours, hp_mul,
+        MONTHLY_TEMPS, DAYS_IN_MONTH
+    )
+    return pd.DataFrame(
+        {"Month": MONTH_NAMES, "Heating": heat, "CHP": chp_m, "HP": hp_m, "Boiler": boiler},
+        copy=False
+    )
+
+
+# --- Charts ---
+@st.cache_resource
+def make_pie_figure(chp_thermal, hp_thermal, boiler_thermal):
+    import plotly.express as px
+
+    return px.pie(
+        values=[chp_thermal, hp_thermal, boiler_thermal],
+        names=["CHP", "Heat Pump", "Boiler"],
+        labels={"names": "Source", "values": "Thermal Output"},
+        title="Thermal Contribution Breakdown"
+    )